@@ -2,6 +2,7 @@
 
 import bpy
 from pathlib import Path
+from typing import Optional
 
 FRAME_END = 30
 SAVE_NAME = "week1ex1.blend"
@@ -10,9 +11,11 @@ SAVE_NAME = "week1ex1.blend"
 def reset_scene() -> None:
     """Return to a predictable factory scene and clear leftover data."""
     bpy.ops.wm.read_factory_settings(use_empty=True)
-    bpy.context.scene.frame_start = 1
-    bpy.context.scene.frame_end = FRAME_END
-    bpy.context.view_layer.update()
+    context = bpy.context
+    scene = context.scene
+    scene.frame_start = 1
+    scene.frame_end = FRAME_END
+    context.view_layer.update()
 
 
 def ensure_object_mode() -> None:
@@ -22,18 +25,52 @@ def ensure_object_mode() -> None:
 
 def clear_objects() -> None:
     ensure_object_mode()
-    bpy.ops.object.select_all(action="SELECT")
-    bpy.ops.object.delete(use_global=False)
+    data = bpy.data
+    ids = (
+        *data.objects,
+        *data.meshes,
+        *data.materials,
+        *data.lights,
+        *data.cameras,
+        *data.actions,
+    )
+    if ids:
+        data.batch_remove(ids=ids)
+
+
+def set_principled(
+    material: bpy.types.Material,
+    *,
+    base_color: Optional[tuple[float, float, float, float]] = None,
+    metallic: Optional[float] = None,
+    roughness: Optional[float] = None,
+) -> None:
+    """Set Principled BSDF inputs by name; socket indices shift between Blender versions."""
+    inputs = material.node_tree.nodes.get("Principled BSDF").inputs
+    if base_color is not None:
+        inputs["Base Color"].default_value = base_color
+    if metallic is not None:
+        inputs["Metallic"].default_value = metallic
+    if roughness is not None:
+        inputs["Roughness"].default_value = roughness
+
+
+def ensure_material(
+    name: str, base_color: tuple[float, float, float, float]
+) -> bpy.types.Material:
+    """Reuse the named material if it exists, building its node tree only once."""
+    material = bpy.data.materials.get(name)
+    if material is None:
+        material = bpy.data.materials.new(name=name)  # type: ignore
+        material.use_nodes = True
+        set_principled(material, base_color=base_color)
+    return material
 
 
 def create_ground() -> bpy.types.Object:
     bpy.ops.mesh.primitive_plane_add(size=20, location=(0.0, 0.0, -1.0))
     plane = bpy.context.active_object
-    material = bpy.data.materials.new(name="GroundMaterial")  # type: ignore
-    material.use_nodes = True
-    bsdf = material.node_tree.nodes.get("Principled BSDF")
-    bsdf.inputs[0].default_value = (0.1, 0.1, 0.12, 1.0)
-    plane.data.materials.append(material)
+    plane.data.materials.append(ensure_material("GroundMaterial", (0.1, 0.1, 0.12, 1.0)))
     return plane
 
 
@@ -44,11 +81,7 @@ def create_cube() -> bpy.types.Object:
     cube = bpy.context.active_object
     cube.name = "Week1Cube"
     cube.data.materials.clear()
-    material = bpy.data.materials.new(name="CubeMaterial")  # type: ignore
-    material.use_nodes = True
-    bsdf = material.node_tree.nodes.get("Principled BSDF")
-    bsdf.inputs[0].default_value = (0.8, 0.2, 0.15, 1.0)
-    cube.data.materials.append(material)
+    cube.data.materials.append(ensure_material("CubeMaterial", (0.8, 0.2, 0.15, 1.0)))
     return cube
 
 
@@ -59,9 +92,22 @@ def keyframe_cube(cube: bpy.types.Object) -> None:
         (15, (0.0, -10.0, 0.0)),
         (30, (30.0, 0.0, 0.0)),
     )
-    for frame, location in timeline:
-        cube.location = location
-        cube.keyframe_insert(data_path="location", frame=frame)
+    # One bulk (frame, value) write per axis instead of a sorted insert per key
+    action = bpy.data.actions.new(name=f"{cube.name}Action")
+    cube.animation_data_create().action = action
+    # Blender 4.4+ (slotted actions) needs the slot-aware helper; older
+    # versions keep F-Curves directly on the action
+    slotted = hasattr(action, "slots")
+    for index in range(3):
+        if slotted:
+            fcurve = action.fcurve_ensure_for_datablock(cube, "location", index=index)
+        else:
+            fcurve = action.fcurves.new("location", index=index)
+        fcurve.keyframe_points.add(len(timeline))
+        fcurve.keyframe_points.foreach_set(
+            "co", [value for frame, location in timeline for value in (frame, location[index])]
+        )
+        fcurve.update()
 
 
 def main() -> None:
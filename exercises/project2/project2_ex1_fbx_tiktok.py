@@ -146,9 +146,6 @@ def setup_camera_tracking(
         )
 
         # Calculate rotation to look at target
-        import math
-
-        rot_quat = camera.rotation_euler.to_quaternion()
         track_quat = direction.to_track_quat("-Z", "Y")
         camera.rotation_euler = track_quat.to_euler()
 